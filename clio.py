@@ -1,15 +1,38 @@
 #!/usr/bin/env python3
 import os
 import json
-import subprocess
-import requests
 import re
 import sys
-import tempfile
+from functools import lru_cache
+
+try:
+    import re2  # Optional: google-re2 matches in linear time with a DFA
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick matches all keywords in one pass
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: faster JSON encoding and decoding
+except ImportError:
+    orjson = None
 
 # API configuration
 API_KEY = os.environ.get("OPENROUTER_API_KEY", "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")
 API_URL = "https://openrouter.ai/api/v1/chat/completions"
+# Opt-in HTTP/2 via httpx (needs httpx and h2). Off by default: with one request per run there is
+# no header compression to gain, and importing httpx is slower than importing requests.
+USE_HTTP2 = os.environ.get("CLIO_HTTP2") == "1"
+
+# Shared client, so callers that import clio and make several API calls in one process
+# reuse the kept-alive connection (the CLI itself makes one call per run).
+# Created on first use, so runs that never reach the API don't import the HTTP libraries.
+_CLIENT = None
+_CLIENT_IS_HTTPX = False
+_HTTP_ERRORS = ()
 
 # Tool detection weights
 TOOL_WEIGHTS = {
@@ -71,7 +94,7 @@ SAFETY_PATTERNS = {
         r"mv\s+.*\s+/dev/null",
         r">\s+/dev/sda", r"mkfs", r"fdisk",
         r"DROP\s+.*DATABASE", r"DROP\s+.*TABLE",
-        r"FORMAT", r"del\s+.*\s+/s\s+/q",
+        r"\bformat\s+[a-z]:", r"del\s+.*\s+/s\s+/q",
         r"rd\s+.*\s+/s\s+/q", r"taskkill\s+.*\s+/f",
     ],
     "moderate_risk": [
@@ -104,34 +127,188 @@ GENERAL_QUERY_PATTERNS = [
     r"bye|goodbye"
 ]
 
+def _json_dumps(obj):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _get_client():
+    """Return the shared HTTP client: a requests session, or an httpx HTTP/2 client if opted in"""
+    global _CLIENT, _CLIENT_IS_HTTPX, _HTTP_ERRORS
+    if _CLIENT is not None:
+        return _CLIENT
+    
+    if USE_HTTP2:
+        try:
+            import httpx
+            import h2  # noqa: F401  (required for http2=True)
+        except ImportError:
+            pass  # Fall back to requests
+        else:
+            # Follow redirects like requests does
+            _CLIENT = httpx.Client(http2=True, timeout=30.0, follow_redirects=True)
+            _CLIENT_IS_HTTPX = True
+            _HTTP_ERRORS = (httpx.HTTPError,)
+            return _CLIENT
+    
+    import requests
+    
+    _CLIENT = requests.Session()
+    _HTTP_ERRORS = (requests.exceptions.RequestException,)
+    return _CLIENT
+
+def _post_json(url, headers, payload):
+    """POST a JSON payload on the shared client and return the raw response body"""
+    client = _get_client()
+    body = _json_dumps(payload)
+    if _CLIENT_IS_HTTPX:
+        response = client.post(url, headers=headers, content=body)
+    else:
+        response = client.post(url, headers=headers, data=body, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+def _compile_fast(pattern):
+    """Compile a case-insensitive pattern with RE2 when available, otherwise with re"""
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass  # Syntax RE2 doesn't support (e.g. lookahead), use re instead
+    return re.compile(pattern, re.IGNORECASE)
+
+# Precompiled patterns, built once at import instead of on every query
+# Each safety level is fused into one alternation so a command is scanned once per level.
+# Hyperscan could do a single multi-pattern scan, but an optional native dependency isn't
+# worth it for ~60 patterns on short commands whose results are memoized.
+DANGEROUS_RE, MODERATE_RISK_RE, LOW_RISK_RE = (
+    _compile_fast("|".join(f"(?:{pattern})" for pattern in SAFETY_PATTERNS[level]))
+    for level in ("dangerous", "moderate_risk", "low_risk")
+)
+
+# Safety levels ordered from least to most cautious
+_SAFETY_IDX = {level: i for i, level in enumerate(["safe", "low_risk", "moderate_risk", "dangerous"])}
+
+# Query patterns run against a lowercased copy of the query: re.IGNORECASE would disable
+# re's literal fast paths and costs more than one short lower() per query
+GENERAL_QUERY_PATTERNS_COMPILED = [re.compile(pattern) for pattern in GENERAL_QUERY_PATTERNS]
+JS_FILE_PATTERN = re.compile(r'\b[\w-]+\.js\b')
+LIST_CONTAINER_PATTERN = re.compile(r'\b(list|show|display).*container')
+
+def _collect_tool_keywords():
+    """Map each distinct keyword to the (tool, weight) pairs it credits ("pull" counts for git and docker)"""
+    keyword_tools = {}
+    for tool, data in TOOL_WEIGHTS.items():
+        for keyword, weight in data["keywords"].items():
+            keyword_tools.setdefault(keyword.lower(), []).append((tool, weight))
+    return keyword_tools
+
+TOOL_KEYWORDS = _collect_tool_keywords()
+
+# Runs of word characters joined by single dots ("server.js", "package.json"). Every keyword is
+# such a chain, and a whole-word keyword hit is always a contiguous part of one of these chains.
+WORD_CHAIN_PATTERN = re.compile(r'\w+(?:\.\w+)*')
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over the lowercased tool keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword, credits in TOOL_KEYWORDS.items():
+        automaton.add_word(keyword, (keyword, credits))
+    automaton.make_automaton()
+    return automaton
+
+TOOL_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+def _is_word_char(text, index):
+    """Return True if text[index] exists and counts as a word character for \\b"""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == "_")
+
+def _iter_keyword_hits(query_lower):
+    """Yield (keyword, credits) for every whole-word tool keyword in the lowercased query"""
+    if TOOL_KEYWORD_AUTOMATON is not None:
+        # The automaton reports every (possibly overlapping) keyword in a single pass;
+        # only the word boundaries are left to check
+        for end, (keyword, credits) in TOOL_KEYWORD_AUTOMATON.iter(query_lower):
+            start = end - len(keyword) + 1
+            if not _is_word_char(query_lower, start - 1) and not _is_word_char(query_lower, end + 1):
+                yield keyword, credits
+    else:
+        # One pass over the query; each chain and its dotted sub-chains are dictionary lookups
+        for match in WORD_CHAIN_PATTERN.finditer(query_lower):
+            chain = match.group()
+            if "." not in chain:
+                if chain in TOOL_KEYWORDS:
+                    yield chain, TOOL_KEYWORDS[chain]
+                continue
+            
+            # "server.js" also contains the keywords "server" and "js"
+            parts = chain.split(".")
+            for first in range(len(parts)):
+                for last in range(first + 1, len(parts) + 1):
+                    candidate = ".".join(parts[first:last])
+                    if candidate in TOOL_KEYWORDS:
+                        yield candidate, TOOL_KEYWORDS[candidate]
+
+# Context clues keyed by directory entry name or extension (clues starting with ".")
+CONTEXT_CLUES = {
+    clue: tool
+    for tool, data in TOOL_WEIGHTS.items()
+    for clue in data["context_clues"]
+    # Path-like clues ("/etc", "C:\\") can never be the name of a directory entry
+    if "/" not in clue and "\\" not in clue
+}
+
+# Zeroed per-tool scores, copied at the start of each detect_tool call
+_SCORES_TEMPLATE = dict.fromkeys(TOOL_WEIGHTS, 0)
+
 def is_general_query(query):
     """Check if the query is general conversation rather than a command request"""
-    query_lower = query.lower()
-    for pattern in GENERAL_QUERY_PATTERNS:
-        if re.search(pattern, query_lower):
+    return _is_general_query_lower(query.lower())
+
+def _is_general_query_lower(query_lower):
+    """is_general_query for an already lowercased query"""
+    for pattern in GENERAL_QUERY_PATTERNS_COMPILED:
+        if pattern.search(query_lower):
             return True
     return False
 
 def detect_tool(query, current_directory="."):
     """Detect the most likely tool based on query and context"""
-    scores = {tool: 0 for tool in TOOL_WEIGHTS}
+    query_lower = query.lower()
+    return _detect_tool_lower(query_lower, current_directory, dict(_iter_keyword_hits(query_lower)))
+
+def _detect_tool_lower(query_lower, current_directory, keyword_hits):
+    """detect_tool for an already lowercased query and its {keyword: credits} hits"""
+    scores = _SCORES_TEMPLATE.copy()
     
-    # Score based on keywords in query
-    for tool, data in TOOL_WEIGHTS.items():
-        for keyword, weight in data["keywords"].items():
-            # Use word boundary for more precise matching
-            if re.search(r'\b' + re.escape(keyword.lower()) + r'\b', query.lower()):
-                scores[tool] += weight
+    # Score based on keywords in query, each distinct keyword counted once
+    for credits in keyword_hits.values():
+        for tool, weight in credits:
+            scores[tool] += weight
     
     # Add context clues from current directory
     try:
-        items = os.listdir(current_directory)
-        for tool, data in TOOL_WEIGHTS.items():
-            for clue in data["context_clues"]:
-                for item in items:
-                    if clue in item:
-                        # Context clues have lower weight to prevent overriding strong query intent
-                        scores[tool] += 15
+        credited = set()
+        with os.scandir(current_directory) as entries:
+            for entry in entries:
+                name = entry.name
+                # Names like ".git" have no extension of their own, so fall back to the full name
+                clue = name if name in CONTEXT_CLUES else os.path.splitext(name)[1] or name
+                if clue in CONTEXT_CLUES and clue not in credited:
+                    credited.add(clue)
+                    # Context clues have lower weight to prevent overriding strong query intent
+                    scores[CONTEXT_CLUES[clue]] += 15
+                    if len(credited) == len(CONTEXT_CLUES):
                         break
     except Exception as e:
         # More specific error handling
@@ -139,68 +316,57 @@ def detect_tool(query, current_directory="."):
     
     # Special case adjustments based on specific patterns
     # Higher priority for Node.js with .js files in query
-    if re.search(r'\b[\w-]+\.js\b', query.lower()):
+    if JS_FILE_PATTERN.search(query_lower):
         scores["nodejs"] += 50
     
     # Docker with container or image listing
-    if re.search(r'\b(list|show|display).*container', query.lower()):
+    if LIST_CONTAINER_PATTERN.search(query_lower):
         scores["docker"] += 60
     
-    # Get the tool with highest score
-    best_tool = max(scores.items(), key=lambda x: x[1])
+    # Get the tool with highest score (first one wins on ties)
+    best_tool = None
+    best_score = 0
+    for tool, score in scores.items():
+        if score > best_score:
+            best_tool = tool
+            best_score = score
     
     # Return None if no significant match
-    if best_tool[1] < 40:
+    if best_score < 40:
         return None
     
-    return best_tool[0]
+    return best_tool
 
 def check_safety(command):
     """Check command safety and return appropriate safety level and confirmation requirement"""
     if not command or not isinstance(command, str):
         return "safe", False
-        
-    command_lower = command.lower()
     
-    for pattern in SAFETY_PATTERNS["dangerous"]:
-        if re.search(pattern, command_lower):
-            return "dangerous", True
-            
-    for pattern in SAFETY_PATTERNS["moderate_risk"]:
-        if re.search(pattern, command_lower):
-            return "moderate_risk", True
-            
-    for pattern in SAFETY_PATTERNS["low_risk"]:
-        if re.search(pattern, command_lower):
-            return "low_risk", False
+    return _classify_command(command)
+
+@lru_cache(maxsize=512)
+def _classify_command(command):
+    """Match a command string against the safety patterns (memoized, commands repeat often)"""
+    if DANGEROUS_RE.search(command):
+        return "dangerous", True
+        
+    if MODERATE_RISK_RE.search(command):
+        return "moderate_risk", True
+        
+    if LOW_RISK_RE.search(command):
+        return "low_risk", False
             
     return "safe", False
 
+# The platform can't change while the process runs; anything not Windows is treated as Linux/Unix-like
+_PLATFORM = "windows" if sys.platform.startswith('win') else "linux"
+
 def get_platform():
     """Detect the user's operating system"""
-    if sys.platform.startswith('win'):
-        return "windows"
-    elif sys.platform.startswith(('linux', 'darwin', 'freebsd')):
-        return "linux"
-    else:
-        return "linux"  # Default to Linux/Unix-like
+    return _PLATFORM
 
-def generate_cli_commands(query):
-    """Generate multiple CLI commands (up to 5) using AI model"""
-    if not query or not isinstance(query, str) or query.strip() == "":
-        return {"error": "Empty query", "commands": []}
-        
-    if is_general_query(query):
-        return {"error": "No Command Found", "commands": []}
-    
-    if not API_KEY:
-        return {"error": "API key not found. Please set OPENROUTER_API_KEY environment variable."}
-    
-    detected_tool = detect_tool(query)
-    platform = get_platform()
-    
-    # Build a prompt that guides the model
-    system_prompt = f"""You are an expert CLI assistant that generates precise, executable commands based on user requests.
+# Invariant parts of the system prompt and the few-shot examples, built once
+_SYSTEM_PROMPT_PREFIX = """You are an expert CLI assistant that generates precise, executable commands based on user requests.
 For the query, respond ONLY with a JSON object containing:
 - 'commands': an array of 1-5 command objects, each containing:
   - 'command': the exact command to run
@@ -211,9 +377,9 @@ For the query, respond ONLY with a JSON object containing:
 Only generate multiple commands (up to 5 maximum) if the task requires sequential steps. 
 If the task can be done with one command, return just one command object in the array.
 
-The detected tool is {detected_tool or "unknown"} and the platform is {platform}.
+"""
 
-Safety guidelines:
+_SYSTEM_PROMPT_SUFFIX = """Safety guidelines:
 - 'dangerous': Commands that could lose data or harm the system (rm -rf, chmod 777)
 - 'moderate_risk': Commands that modify state but are generally recoverable (git push, docker stop)
 - 'low_risk': Commands that make minor changes (git commit, mkdir)
@@ -227,14 +393,37 @@ IMPORTANT: Output ONLY valid JSON without any other text, explanation, or markdo
 Do not generate commands for general conversation or non-command queries.
 """
 
-    examples = [
-        {"role": "user", "content": "push my code"},
-        {"role": "assistant", "content": '{"commands": [{"command": "git push origin main", "description": "Pushes committed code changes to the main branch on the remote repository", "safety_level": "moderate_risk", "confirm_required": true}]}'},
-        {"role": "user", "content": "create a new folder called project and initialize a git repo inside it"},
-        {"role": "assistant", "content": '{"commands": [{"command": "mkdir project", "description": "Creates a new directory named project", "safety_level": "low_risk", "confirm_required": false}, {"command": "cd project", "description": "Changes directory to the newly created project folder", "safety_level": "safe", "confirm_required": false}, {"command": "git init", "description": "Initializes a new Git repository", "safety_level": "low_risk", "confirm_required": false}]}'},
-        {"role": "user", "content": "how are you doing today?"},
-        {"role": "assistant", "content": '{"error": "No Command Found", "commands": []}'}
-    ]
+_EXAMPLES = [
+    {"role": "user", "content": "push my code"},
+    {"role": "assistant", "content": '{"commands": [{"command": "git push origin main", "description": "Pushes committed code changes to the main branch on the remote repository", "safety_level": "moderate_risk", "confirm_required": true}]}'},
+    {"role": "user", "content": "create a new folder called project and initialize a git repo inside it"},
+    {"role": "assistant", "content": '{"commands": [{"command": "mkdir project", "description": "Creates a new directory named project", "safety_level": "low_risk", "confirm_required": false}, {"command": "cd project", "description": "Changes directory to the newly created project folder", "safety_level": "safe", "confirm_required": false}, {"command": "git init", "description": "Initializes a new Git repository", "safety_level": "low_risk", "confirm_required": false}]}'},
+    {"role": "user", "content": "how are you doing today?"},
+    {"role": "assistant", "content": '{"error": "No Command Found", "commands": []}'}
+]
+
+def generate_cli_commands(query):
+    """Generate multiple CLI commands (up to 5) using AI model"""
+    if not query or not isinstance(query, str) or query.strip() == "":
+        return {"error": "Empty query", "commands": []}
+        
+    # Reject conversation locally, before any network I/O, unless the query also names a tool keyword.
+    # The same hits are reused for scoring below, so the query is only scanned once.
+    query_lower = query.lower()
+    keyword_hits = dict(_iter_keyword_hits(query_lower))
+    if not keyword_hits and _is_general_query_lower(query_lower):
+        return {"error": "No Command Found", "commands": []}
+    
+    if not API_KEY:
+        return {"error": "API key not found. Please set OPENROUTER_API_KEY environment variable."}
+    
+    detected_tool = _detect_tool_lower(query_lower, ".", keyword_hits)
+    platform = get_platform()
+    
+    # Only the detected tool and platform vary between calls
+    system_prompt = (_SYSTEM_PROMPT_PREFIX
+                     + f"The detected tool is {detected_tool or 'unknown'} and the platform is {platform}.\n\n"
+                     + _SYSTEM_PROMPT_SUFFIX)
     
     headers = {
         "Content-Type": "application/json",
@@ -245,7 +434,7 @@ Do not generate commands for general conversation or non-command queries.
         "model": "deepseek/deepseek-chat",
         "messages": [
             {"role": "system", "content": system_prompt},
-            *examples,
+            *_EXAMPLES,
             {"role": "user", "content": query}
         ],
         "max_tokens": 400,
@@ -253,27 +442,21 @@ Do not generate commands for general conversation or non-command queries.
     }
     
     try:
-        response = requests.post(API_URL, headers=headers, json=data, timeout=30)
-        response.raise_for_status()
-        response_data = response.json()
+        response_data = _json_loads(_post_json(API_URL, headers, data))
         
         # Extract the AI's response
         ai_response = response_data["choices"][0]["message"]["content"].strip()
         
-        # Clean the response to ensure it's valid JSON
-        # Remove markdown code blocks if present
-        ai_response = re.sub(r'```json\s*|\s*```', '', ai_response)
-        
-        # Clean any non-JSON text before or after
-        ai_response = re.search(r'({.*})', ai_response, re.DOTALL)
-        if ai_response:
-            ai_response = ai_response.group(1)
-        else:
+        # Keep only the outermost JSON object, dropping markdown fences and any other text around it
+        start = ai_response.find("{")
+        end = ai_response.rfind("}")
+        if start < 0 or end <= start:
             return {"error": "Invalid response format from API", "commands": []}
+        ai_response = ai_response[start:end + 1]
         
         try:
-            response_json = json.loads(ai_response)
-        except json.JSONDecodeError:
+            response_json = _json_loads(ai_response)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
             return {"error": "Failed to parse JSON response", "commands": []}
         
         # Check if response has an error field
@@ -306,9 +489,10 @@ Do not generate commands for general conversation or non-command queries.
             safety_level, confirm_required = check_safety(cmd_data["command"])
             
             # Override model's safety classification if our check is more cautious
-            safety_levels = ["safe", "low_risk", "moderate_risk", "dangerous"]
-            model_safety_idx = safety_levels.index(cmd_data["safety_level"]) if cmd_data["safety_level"] in safety_levels else 0
-            our_safety_idx = safety_levels.index(safety_level)
+            # The model may send any JSON value here; non-strings rank as "safe" like unknown levels
+            level = cmd_data["safety_level"]
+            model_safety_idx = _SAFETY_IDX.get(level, 0) if isinstance(level, str) else 0
+            our_safety_idx = _SAFETY_IDX[safety_level]
             
             if our_safety_idx > model_safety_idx:
                 response_json["commands"][i]["safety_level"] = safety_level
@@ -320,7 +504,7 @@ Do not generate commands for general conversation or non-command queries.
         
         return response_json
         
-    except requests.exceptions.RequestException as e:
+    except _HTTP_ERRORS as e:  # Set by _get_client once the HTTP library is imported
         return {"error": f"API request failed: {str(e)}", "commands": []}
     except Exception as e:
         return {"error": f"Unexpected error: {str(e)}", "commands": []}
@@ -361,6 +545,41 @@ def display_friendly_output(command_data):
     
     return True
 
+# Characters cmd.exe treats as operators outside double quotes
+CMD_SPECIAL_CHARS = frozenset('&|<>^')
+
+def _escape_for_echo(command):
+    """Escape cmd.exe operators with ^ outside double-quoted segments, so echo prints the command as is"""
+    escaped = []
+    quoted = False
+    for char in command:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in CMD_SPECIAL_CHARS:
+            escaped.append("^")  # Inside quotes cmd would print the ^ literally
+        escaped.append(char)
+    return "".join(escaped)
+
+# Characters that need /bin/sh: pipes, chaining, redirection, expansion, globbing, grouping, comments
+SHELL_SYNTAX_CHARS = re.compile(r'[|&;<>$`*?\[\]~(){}#\n]')
+
+def _direct_argv(command):
+    """Split a command into argv if it can be spawned without a shell, otherwise return None"""
+    import shlex
+    import shutil
+    
+    if SHELL_SYNTAX_CHARS.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None  # Unbalanced quotes, let the shell report it
+    
+    # Builtins (cd, export) and VAR=value prefixes only work inside the shell
+    if not argv or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
 def execute_commands(command_data):
     """Execute the generated commands with correct directory persistence"""
     if "error" in command_data and command_data["error"]:
@@ -376,38 +595,26 @@ def execute_commands(command_data):
     if any_confirm_required:
         print("\nNote: Some commands carry risk and require confirmation.")
     
+    import subprocess
+    
     # Platform-specific execution
-    if sys.platform.startswith('win'):
-        # Create a batch file with all commands
-        batch_commands = ["@echo off"]
+    if _PLATFORM == "windows":
+        # Chain the commands on one cmd.exe line instead of writing a temporary batch file.
+        # "&&" stops at the first failure and "cd" carries over to the following commands.
+        steps = []
         for cmd in command_data['commands']:
             if not cmd.get("command"):
                 continue
-            batch_commands.append(f"echo Executing: {cmd['command']}")
-            batch_commands.append(cmd['command'])
-            batch_commands.append("if %errorlevel% neq 0 (")
-            batch_commands.append("  echo Command failed with error %errorlevel%")
-            batch_commands.append("  pause")
-            batch_commands.append("  exit /b %errorlevel%")
-            batch_commands.append(")")
+            steps.append(f"echo Executing: {_escape_for_echo(cmd['command'])} && {cmd['command']}")
         
-        # Write to a temporary batch file
         try:
-            with tempfile.NamedTemporaryFile(suffix='.bat', delete=False, mode='w') as f:
-                temp_batch = f.name
-                f.write("\n".join(batch_commands))
-            
-            # Execute the batch file
-            subprocess.run(temp_batch, shell=True, check=False)
+            # /S keeps everything between the outer quotes verbatim
+            result = subprocess.run(f'cmd.exe /Q /S /C "{" && ".join(steps)}"', check=False)
+            if result.returncode != 0:
+                print(f"Command failed with error {result.returncode}")
             print("Commands execution completed.")
         except Exception as e:
             print(f"Error during execution: {e}")
-        finally:
-            # Clean up the temporary file
-            try:
-                os.remove(temp_batch)
-            except:
-                pass
     else:
         # For Unix-like systems, execute commands sequentially
         for i, cmd in enumerate(command_data['commands']):
@@ -416,16 +623,21 @@ def execute_commands(command_data):
                 
             print(f"\nExecuting: {cmd['command']}")
             try:
-                result = subprocess.run(cmd['command'], shell=True, capture_output=True, text=True)
+                # Spawn simple commands directly, skipping the extra /bin/sh process
+                argv = _direct_argv(cmd['command'])
                 
-                # Print command output
-                if result.stdout:
-                    print(result.stdout)
+                # Stream output line by line (stderr merged in) instead of buffering it all
+                with subprocess.Popen(argv or cmd['command'], shell=argv is None, stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT, text=True, bufsize=1) as process:
+                    line = ""
+                    for line in process.stdout:
+                        sys.stdout.write(line)
+                    if line and not line.endswith("\n"):
+                        sys.stdout.write("\n")
+                    returncode = process.wait()
                 
-                if result.returncode != 0:
-                    print(f"Command failed with error code {result.returncode}")
-                    if result.stderr:
-                        print(f"Error details: {result.stderr}")
+                if returncode != 0:
+                    print(f"Command failed with error code {returncode}")
                     
                     should_continue = input("Continue with remaining commands? (Y/N): ")
                     if should_continue.lower() != 'y':
@@ -442,17 +654,20 @@ def execute_commands(command_data):
 
 def main():
     # Check if --json-only flag is present (for VS Code extension)
-    json_only = "--json-only" in sys.argv
-    if json_only and "--json-only" in sys.argv:
-        # Remove the flag from arguments
-        sys.argv.remove("--json-only")
+    argv = sys.argv[1:]
+    json_only = False
+    if "--json-only" in argv:
+        json_only = True
+        # Remove the flag from the query words
+        argv = [arg for arg in argv if arg != "--json-only"]
         
-    if len(sys.argv) > 1:
-        query = " ".join(sys.argv[1:])
+    if argv:
+        query = " ".join(argv)
         result = generate_cli_commands(query)
         
         if json_only:
             # Return only JSON output for programmatic usage
+            # (stdlib json keeps the output ASCII-only for the extension's pipe)
             print(json.dumps(result))
             return
         